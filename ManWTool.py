@@ -1,7 +1,7 @@
 bl_info = {
     "name": "ManWTool",
     "author": "Jairo (ManW)",
-    "version": (0, 0, 9),
+    "version": (0, 1, 0),
     "blender": (3, 6, 0),
     "location": "View3D > Sidebar (N) > ManWTool",
     "description": "Colecciones, renombrado y export FBX con ReExport.",
@@ -16,6 +16,20 @@ import json
 import zipfile
 import tempfile
 import shutil
+import sqlite3
+import hashlib
+import time
+import array
+import struct
+import socket
+import errno
+import stat
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
 
 from bpy.types import Panel, Operator, PropertyGroup, AddonPreferences
 from bpy.props import PointerProperty, StringProperty, BoolProperty
@@ -29,6 +43,9 @@ ADDON_ID = __name__
 GITHUB_USER = "ManWitoo"      # Cambia esto
 GITHUB_REPO = "ManWTool"        # Cambia esto
 
+# URL de la API de releases (se puede apuntar a un servidor local para pruebas)
+GITHUB_API_URL = f"https://api.github.com/repos/{GITHUB_USER}/{GITHUB_REPO}/releases/latest"
+
 # Variable global para almacenar info de actualización
 _update_info = {
     "checking": False,
@@ -39,6 +56,55 @@ _update_info = {
     "error": None,
 }
 
+# Estado precalculado de los paneles. Se invalida vía bpy.msgbus, handlers y
+# el sistema de actualización; los draw() solo leen estos valores.
+_panel_cache = {
+    "dirty": True,
+    "key": None,
+    "status": ("Sin objeto activo", "ERROR", "ERROR"),
+    "can_run": False,
+    "rename_preview": "",
+    "last_dir": "",
+    "has_last_dir": False,
+    "show_update": False,
+    "debug": False,
+}
+
+# Contador de depuración: recálculos vs redibujados de paneles
+_panel_stats = {"recomputes": 0, "redraws": 0}
+
+# Dueño de las suscripciones de bpy.msgbus
+_msgbus_owner = object()
+
+# Último resumen del ordenador de objetos (previsualización o aplicado)
+_sort_preview = {
+    "applied": False,
+    "counts": {},
+    "unchanged": 0,
+    "unmatched": 0,
+    "blocked": 0,
+    "moves": [],
+}
+
+# Nombre del índice SQLite que se guarda en la raíz de exportación
+EXPORT_INDEX_NAME = ".manwtool_index.sqlite"
+
+# Registro rotativo de eventos de export (JSON por línea) en la raíz de exportación
+EXPORT_EVENTS_NAME = ".manwtool_events.jsonl"
+EXPORT_EVENTS_MAX_BYTES = 256 * 1024
+
+# Último resultado de la revisión del índice (se muestra en el panel)
+_index_status = {
+    "base_dir": "",
+    "stale": [],
+    "missing": [],
+    "orphaned": [],
+    "modified": [],
+    "total": 0,
+    "elapsed_ms": 0.0,
+    "error": None,
+}
+
 
 # -------------------------------------------------
 # Preferencias
@@ -52,6 +118,20 @@ class MANWTOOL_Preferences(AddonPreferences):
         default=True,
     )
 
+    debug_panel_cache: BoolProperty(
+        name="Mostrar contador de caché (debug)",
+        description="Muestra en los paneles cuántas veces se recalculó su estado frente a cuántas se redibujaron",
+        default=False,
+        update=lambda self, context: _invalidate_panel_cache(),
+    )
+
+    event_endpoint: StringProperty(
+        name="Canal de eventos",
+        description="Opcional. Puerto UDP local ('9000', '127.0.0.1:9000' o '[::1]:9000') o named pipe/FIFO "
+                    "donde publicar cada export. Vacío = solo el archivo de eventos",
+        default="",
+    )
+
     def draw(self, context):
         layout = self.layout
         layout.label(text="Preferencias de ManWTool")
@@ -69,6 +149,14 @@ class MANWTOOL_Preferences(AddonPreferences):
             row = box.row()
             row.operator("manwtool.check_updates", icon="FILE_REFRESH")
 
+        box = layout.box()
+        box.label(text="Eventos de exportación:", icon="EXPORT")
+        box.prop(self, "event_endpoint")
+
+        box = layout.box()
+        box.label(text="Depuración:", icon="CONSOLE")
+        box.prop(self, "debug_panel_cache")
+
 
 # -------------------------------------------------
 # Sistema de actualización simplificado
@@ -78,6 +166,54 @@ def _compare_versions(current, remote):
     return remote > current
 
 
+def _parse_version_tag(tag_name):
+    """'v0.0.8' / '0.0.8' -> (0, 0, 8). Retorna None si el formato no es válido"""
+    parts = (tag_name or "").strip().lstrip("vV").split(".")
+    if len(parts) < 3:
+        return None
+    try:
+        return tuple(int(x) for x in parts[:3])
+    except ValueError:
+        return None
+
+
+def _find_zip_asset(assets):
+    """URL de descarga del primer asset .zip de la release, o None"""
+    for asset in assets or []:
+        if asset.get("name", "").endswith(".zip"):
+            return asset.get("browser_download_url")
+    return None
+
+
+def _parse_release(data, current_version):
+    """Interpreta la respuesta de la API de releases (sin red ni bpy).
+
+    Retorna (versión remota, url del .zip, notas) si hay una versión más nueva,
+    o None si ya está al día. Lanza ValueError con el mensaje para el usuario.
+    """
+    remote_version = _parse_version_tag(data.get("tag_name"))
+    if remote_version is None:
+        raise ValueError("Formato de versión no válido en GitHub")
+
+    if not _compare_versions(current_version, remote_version):
+        return None
+
+    download_url = _find_zip_asset(data.get("assets"))
+    if not download_url:
+        raise ValueError("No se encontró archivo .zip en la release")
+
+    return remote_version, download_url, (data.get("body") or "")[:200]  # Primeras 200 chars
+
+
+def _fetch_latest_release(api_url, timeout=10):
+    """Descarga el JSON de la última release"""
+    req = urllib.request.Request(api_url)
+    req.add_header('Accept', 'application/vnd.github.v3+json')
+
+    with urllib.request.urlopen(req, timeout=timeout) as response:
+        return json.loads(response.read().decode())
+
+
 def _check_for_updates_thread():
     """Verifica actualizaciones consultando GitHub Releases API"""
     global _update_info
@@ -89,44 +225,26 @@ def _check_for_updates_thread():
     
     _update_info["checking"] = True
     _update_info["error"] = None
+    _invalidate_panel_cache()
     
     try:
         # Consultar la última release de GitHub
-        api_url = f"https://api.github.com/repos/{GITHUB_USER}/{GITHUB_REPO}/releases/latest"
-        
-        req = urllib.request.Request(api_url)
-        req.add_header('Accept', 'application/vnd.github.v3+json')
-        
-        with urllib.request.urlopen(req, timeout=10) as response:
-            data = json.loads(response.read().decode())
+        data = _fetch_latest_release(GITHUB_API_URL)
         
-        # Extraer versión del tag (ej: "v0.0.8" o "0.0.8")
-        tag_name = data.get("tag_name", "").replace("v", "").replace("V", "")
-        version_parts = tag_name.split(".")
+        try:
+            release = _parse_release(data, bl_info["version"])
+        except ValueError as e:
+            _update_info["error"] = str(e)
+            release = None
         
-        if len(version_parts) >= 3:
-            remote_version = tuple(int(x) for x in version_parts[:3])
-            current_version = bl_info["version"]
-            
-            if _compare_versions(current_version, remote_version):
-                # Buscar el asset .zip en la release
-                download_url = None
-                for asset in data.get("assets", []):
-                    if asset["name"].endswith(".zip"):
-                        download_url = asset["browser_download_url"]
-                        break
-                
-                if download_url:
-                    _update_info["available"] = True
-                    _update_info["version"] = remote_version
-                    _update_info["download_url"] = download_url
-                    _update_info["notes"] = data.get("body", "")[:200]  # Primeras 200 chars
-                else:
-                    _update_info["error"] = "No se encontró archivo .zip en la release"
-            else:
-                _update_info["available"] = False
+        if release:
+            remote_version, download_url, notes = release
+            _update_info["available"] = True
+            _update_info["version"] = remote_version
+            _update_info["download_url"] = download_url
+            _update_info["notes"] = notes
         else:
-            _update_info["error"] = "Formato de versión no válido en GitHub"
+            _update_info["available"] = False
             
     except Exception as e:
         _update_info["error"] = f"Error al conectar: {str(e)[:50]}"
@@ -134,6 +252,7 @@ def _check_for_updates_thread():
     
     finally:
         _update_info["checking"] = False
+        _invalidate_panel_cache()
 
 
 def _download_and_install_update(download_url):
@@ -227,6 +346,7 @@ class MANWTOOL_OT_install_update(Operator):
         if success:
             self.report({"INFO"}, message)
             _update_info["available"] = False
+            _invalidate_panel_cache()
         else:
             self.report({"ERROR"}, message)
         
@@ -241,6 +361,7 @@ class MANWTOOL_OT_dismiss_update(Operator):
     def execute(self, context):
         global _update_info
         _update_info["available"] = False
+        _invalidate_panel_cache()
         return {"FINISHED"}
 
 
@@ -285,6 +406,27 @@ class MANWTOOL_Properties(PropertyGroup):
         default="Object",
     )
 
+    sort_high_rules: StringProperty(
+        name="High",
+        description="Reglas separadas por comas. Terminadas en '_' son prefijos, el resto sufijos",
+        default="_high, _hp",
+    )
+    sort_low_rules: StringProperty(
+        name="Low",
+        description="Reglas separadas por comas. Terminadas en '_' son prefijos, el resto sufijos",
+        default="_low, _lp",
+    )
+    sort_ref_rules: StringProperty(
+        name="Reference",
+        description="Reglas separadas por comas. Terminadas en '_' son prefijos, el resto sufijos",
+        default="ref_, _ref",
+    )
+    sort_selected_only: BoolProperty(
+        name="Solo selección",
+        description="Ordenar solo los objetos seleccionados en lugar de toda la escena",
+        default=False,
+    )
+
     last_export_dir: StringProperty(
         name="Última carpeta",
         description="Carpeta usada en el último export. Se usa para ReExport.",
@@ -305,7 +447,77 @@ def _active_obj_status(context):
     return (f"Activo: {obj.name} (MESH)", "INFO", "MESH_CUBE")
 
 
-def _draw_header(panel, context, show_status=True):
+def _invalidate_panel_cache(*args):
+    """Marca el estado de los paneles para recalcularlo en el próximo draw"""
+    _panel_cache["dirty"] = True
+
+
+def _panel_state(context):
+    """Devuelve el estado precalculado de los paneles, recalculándolo solo si hace falta"""
+    _panel_stats["redraws"] += 1
+
+    obj = context.active_object
+    key = (context.scene.as_pointer(), obj.as_pointer() if obj else 0)
+    if not _panel_cache["dirty"] and _panel_cache["key"] == key:
+        return _panel_cache
+
+    _panel_stats["recomputes"] += 1
+    props = context.scene.manwtool_props
+
+    _panel_cache["status"] = _active_obj_status(context)
+    _panel_cache["can_run"] = (obj is not None and obj.type == "MESH")
+    _panel_cache["rename_preview"] = _compose_name(props.rename_prefix, props.rename_base)
+    _panel_cache["last_dir"] = bpy.path.abspath(props.last_export_dir) if props.last_export_dir else ""
+    _panel_cache["has_last_dir"] = bool((props.last_export_dir or "").strip())
+    _panel_cache["show_update"] = bool(
+        _update_info["checking"] or (_update_info["available"] and not _update_info["error"])
+    )
+
+    try:
+        _panel_cache["debug"] = context.preferences.addons[ADDON_ID].preferences.debug_panel_cache
+    except Exception:
+        _panel_cache["debug"] = False
+
+    _panel_cache["key"] = key
+    _panel_cache["dirty"] = False
+    return _panel_cache
+
+
+def _subscribe_msgbus():
+    """Suscribe la invalidación de la caché a los cambios relevantes (se pierde al cargar un .blend)"""
+    bpy.msgbus.clear_by_owner(_msgbus_owner)
+
+    keys = [
+        (bpy.types.LayerObjects, "active"),
+        (bpy.types.Object, "name"),
+        (bpy.types.Object, "type"),
+    ]
+    for prop in ("root_name", "rename_prefix", "rename_base", "last_export_dir"):
+        keys.append((MANWTOOL_Properties, prop))
+
+    for key in keys:
+        bpy.msgbus.subscribe_rna(
+            key=key,
+            owner=_msgbus_owner,
+            args=(),
+            notify=_invalidate_panel_cache,
+        )
+
+
+@persistent
+def _panel_cache_load_post(dummy):
+    """Las suscripciones de msgbus se borran al cargar un archivo: se vuelven a crear"""
+    _invalidate_panel_cache()
+    _subscribe_msgbus()
+
+
+@persistent
+def _panel_cache_invalidate_handler(dummy):
+    """Deshacer/rehacer y guardar (rutas relativas) no pasan por msgbus"""
+    _invalidate_panel_cache()
+
+
+def _draw_header(panel, state, show_status=True):
     layout = panel.layout
 
     row = layout.row(align=True)
@@ -315,10 +527,18 @@ def _draw_header(panel, context, show_status=True):
 
     row.label(text=f"{title}  v{ver}", icon="TOOL_SETTINGS")
 
+    if state["debug"]:
+        dbg = layout.row()
+        dbg.enabled = False
+        dbg.label(
+            text=f"Caché: {_panel_stats['recomputes']} recálculos / {_panel_stats['redraws']} redibujados",
+            icon="CONSOLE",
+        )
+
     if not show_status:
         return
 
-    status, level, icon = _active_obj_status(context)
+    status, level, icon = state["status"]
     row2 = layout.row()
     if level in {"ERROR", "WARNING"}:
         row2.alert = True
@@ -364,12 +584,476 @@ def _draw_update_notification(layout):
         row.operator("manwtool.dismiss_update", text="Mas Tarde", icon="X")
 
 
+def _draw_index_status(layout):
+    """Dibuja el resumen de la última revisión del índice de exportación"""
+    box = layout.box()
+    box.label(text="Índice de exportación", icon="PRESET")
+
+    if _index_status["error"]:
+        row = box.row()
+        row.alert = True
+        row.label(text=_index_status["error"], icon="ERROR")
+    elif _index_status["base_dir"]:
+        col = box.column(align=True)
+        col.label(text=f"Exports: {_index_status['total']}  ({_index_status['elapsed_ms']:.1f} ms)")
+        col.label(text=f"Obsoletos: {len(_index_status['stale'])}", icon="FILE_REFRESH")
+        col.label(text=f"Perdidos: {len(_index_status['missing'])}", icon="ERROR")
+        col.label(text=f"Huérfanos: {len(_index_status['orphaned'])}", icon="UNLINKED")
+        col.label(text=f"Modificados en disco: {len(_index_status['modified'])}", icon="FILE")
+
+    row = box.row(align=True)
+    row.operator("manwtool.check_export_index", icon="VIEWZOOM").deep = False
+    row.operator("manwtool.check_export_index", text="Profunda", icon="ZOOM_IN").deep = True
+    sub = row.row(align=True)
+    sub.enabled = bool(_index_status["stale"] or _index_status["missing"])
+    sub.operator("manwtool.reexport_stale", icon="FILE_REFRESH")
+
+
+def _draw_sort_preview(layout):
+    """Dibuja el resumen del último ordenado (o de su previsualización)"""
+    if not _sort_preview["counts"]:
+        return
+
+    sub = layout.box()
+    col = sub.column(align=True)
+    col.label(text="Aplicado:" if _sort_preview["applied"] else "Previsualización:", icon="INFO")
+    for name, n in _sort_preview["counts"].items():
+        col.label(text=f"{name}: {n}")
+    col.label(text=f"Ya en su sitio: {_sort_preview['unchanged']}  Sin regla: {_sort_preview['unmatched']}")
+    if _sort_preview["blocked"]:
+        row = col.row()
+        row.alert = True
+        row.label(text=f"En colecciones de librería: {_sort_preview['blocked']}", icon="LIBRARY_DATA_DIRECT")
+
+    if _sort_preview["moves"]:
+        col = sub.column(align=True)
+        col.enabled = False
+        for obj_name, col_name in _sort_preview["moves"]:
+            col.label(text=f"{obj_name} → {col_name}")
+
+
 def _big_button(row_or_layout):
     r = row_or_layout.row()
     r.scale_y = 1.35
     return r
 
 
+# -------------------------------------------------
+# Índice de exportación (SQLite)
+# -------------------------------------------------
+def _file_sha1(path):
+    """SHA1 del contenido de un archivo, leído por bloques"""
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _index_connect(base_dir):
+    """Abre (y crea si hace falta) el índice SQLite de la raíz de exportación"""
+    conn = sqlite3.connect(os.path.join(base_dir, EXPORT_INDEX_NAME), timeout=5)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS exports ("
+        " fbx_path TEXT PRIMARY KEY,"
+        " object_name TEXT NOT NULL,"
+        " blend_file TEXT NOT NULL,"
+        " exported_at REAL NOT NULL,"
+        " fbx_mtime REAL NOT NULL,"
+        " fbx_size INTEGER NOT NULL,"
+        " content_hash TEXT NOT NULL,"
+        " source_hash TEXT NOT NULL,"
+        " signature TEXT NOT NULL DEFAULT '')"
+    )
+    # Índices creados por versiones anteriores no tienen la columna signature
+    columns = [row[1] for row in conn.execute("PRAGMA table_info(exports)")]
+    if "signature" not in columns:
+        conn.execute("ALTER TABLE exports ADD COLUMN signature TEXT NOT NULL DEFAULT ''")
+    conn.execute("CREATE INDEX IF NOT EXISTS exports_blend ON exports (blend_file, object_name)")
+    return conn
+
+
+def _index_record_export(base_dir, fbx_path, object_name, blend_file, source_hash, signature="",
+                         content_hash=None):
+    """Registra (o actualiza) un export en el índice. Retorna el hash del FBX"""
+    st = os.stat(fbx_path)
+    if content_hash is None:
+        content_hash = _file_sha1(fbx_path)
+    rel_path = os.path.relpath(fbx_path, base_dir).replace("\\", "/")
+
+    conn = _index_connect(base_dir)
+    try:
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO exports (fbx_path, object_name, blend_file, exported_at,"
+                " fbx_mtime, fbx_size, content_hash, source_hash, signature)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (rel_path, object_name, blend_file, time.time(),
+                 st.st_mtime, st.st_size, content_hash, source_hash, signature),
+            )
+    finally:
+        conn.close()
+    return content_hash
+
+
+def _index_query(base_dir, blend_file=None, signature_fn=None, source_hash_fn=None):
+    """Clasifica los exports del índice sin tocar bpy.
+
+    - missing:  el FBX ya no existe en disco.
+    - orphaned: el .blend de origen ya no existe (o nunca se guardó), o (para blend_file)
+                el objeto ya no está.
+    - modified: el FBX cambió en disco desde el export (tamaño/fecha).
+    - stale:    el objeto fuente ya no produciría el mismo FBX. Requiere signature_fn(name)
+                (firma sin evaluar la malla, None si el objeto no existe). source_hash_fn(name)
+                es opcional (revisión profunda) y solo se llama si la firma coincide.
+
+    Cada entrada es (object_name, fbx_path relativo, blend_file).
+    """
+    result = {"stale": [], "missing": [], "orphaned": [], "modified": [], "total": 0}
+
+    db_path = os.path.join(base_dir, EXPORT_INDEX_NAME)
+    if not os.path.isfile(db_path):
+        return result
+
+    conn = sqlite3.connect(db_path, timeout=5)
+    try:
+        rows = conn.execute(
+            "SELECT fbx_path, object_name, blend_file, fbx_mtime, fbx_size, source_hash, signature"
+            " FROM exports"
+        ).fetchall()
+    finally:
+        conn.close()
+
+    blend_exists = {}
+    for fbx_rel, name, blend, mtime, size, source_hash, signature in rows:
+        result["total"] += 1
+        entry = (name, fbx_rel, blend)
+
+        # Exports de un .blend sin guardar: no hay forma de saber de qué archivo vienen
+        if not blend:
+            result["orphaned"].append(entry)
+            continue
+
+        current_signature = None
+        if signature_fn is not None and blend == blend_file:
+            current_signature = signature_fn(name)
+            if current_signature is None:
+                result["orphaned"].append(entry)
+                continue
+        else:
+            if blend not in blend_exists:
+                blend_exists[blend] = os.path.isfile(blend)
+            if not blend_exists[blend]:
+                result["orphaned"].append(entry)
+                continue
+
+        try:
+            st = os.stat(os.path.join(base_dir, fbx_rel))
+        except OSError:
+            result["missing"].append(entry)
+            continue
+
+        if st.st_size != size or abs(st.st_mtime - mtime) > 1e-3:
+            result["modified"].append(entry)
+        if current_signature is not None:
+            if current_signature != signature:
+                result["stale"].append(entry)
+            elif source_hash_fn is not None and source_hash_fn(name) != source_hash:
+                result["stale"].append(entry)
+
+    return result
+
+
+# Propiedades de modificador que no cambian la malla exportada
+_SIGNATURE_SKIP_PROPS = {
+    "rna_type", "name", "show_expanded", "show_in_editmode", "show_on_cage", "show_render",
+    "is_active", "is_override_data_editable", "use_pin_to_last", "persistent_uid",
+}
+
+
+def _hash_mesh(h, mesh, matrix_world, materials):
+    """Añade a h la rot/escala (sin ubicación: el export la lleva a 0,0,0), la geometría, UVs y materiales"""
+    for row in matrix_world.to_3x3():
+        h.update(struct.pack("3f", *row))
+
+    co = array.array("f", [0.0]) * (len(mesh.vertices) * 3)
+    mesh.vertices.foreach_get("co", co)
+    h.update(co.tobytes())
+    loops = array.array("i", [0]) * len(mesh.loops)
+    mesh.loops.foreach_get("vertex_index", loops)
+    h.update(loops.tobytes())
+
+    for uv_layer in mesh.uv_layers:
+        h.update(uv_layer.name.encode())
+        uvs = array.array("f", [0.0]) * (len(uv_layer.data) * 2)
+        uv_layer.data.foreach_get("uv", uvs)
+        h.update(uvs.tobytes())
+
+    for m in materials:
+        h.update((m.name if m else "").encode())
+
+
+def _mesh_fingerprint(mesh, matrix_world, materials):
+    """Huella de lo que acaba en el FBX, calculada sobre la malla evaluada (bakeada)"""
+    h = hashlib.sha1()
+    _hash_mesh(h, mesh, matrix_world, materials)
+    return h.hexdigest()
+
+
+def _rna_signature(struct_rna):
+    """Valores de todas las propiedades RNA de un struct (p.ej. un modificador), leídos vía bl_rna"""
+    parts = []
+    for prop in struct_rna.bl_rna.properties:
+        key = prop.identifier
+        if key in _SIGNATURE_SKIP_PROPS or prop.type == "COLLECTION":
+            continue
+        value = getattr(struct_rna, key, None)
+        if prop.type == "POINTER":
+            if value is None:
+                parts.append(f"{key}=None")
+            elif hasattr(value, "matrix_world"):
+                # Objeto referenciado (cortador de Boolean, Mirror...): su transformación también cuenta
+                matrix = ",".join(f"{v:.6g}" for row in value.matrix_world for v in row)
+                parts.append(f"{key}={value.name}@{matrix}")
+            else:
+                parts.append(f"{key}={getattr(value, 'name', '')}")
+            continue
+        if getattr(prop, "array_length", 0):
+            value = tuple(value)
+        parts.append(f"{key}={value!r}")
+    return "|".join(parts)
+
+
+def _object_signature(obj):
+    """Firma del objeto sin evaluar la malla: datos originales, UVs, materiales, rot/escala
+    y la pila de modificadores con sus parámetros.
+
+    Basta para saber si el export está obsoleto. La huella de la malla evaluada
+    (_mesh_fingerprint) queda para el export y la revisión profunda.
+    """
+    h = hashlib.sha1()
+    _hash_mesh(h, obj.data, obj.matrix_world, obj.data.materials)
+    for mod in obj.modifiers:
+        h.update(f"{mod.name}|{mod.type}|{_rna_signature(mod)}".encode())
+    return h.hexdigest()
+
+
+def _current_signature(name):
+    """Firma del objeto con ese nombre en el .blend actual, o None si no existe"""
+    obj = bpy.data.objects.get(name)
+    if obj is None or obj.type != "MESH":
+        return None
+    return _object_signature(obj)
+
+
+def _current_source_hash(name):
+    """Huella completa (malla evaluada) del objeto con ese nombre en el .blend actual"""
+    obj = bpy.data.objects.get(name)
+    if obj is None or obj.type != "MESH":
+        return None
+
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    eval_obj = obj.evaluated_get(depsgraph)
+    mesh = eval_obj.to_mesh(preserve_all_data_layers=True, depsgraph=depsgraph)
+    try:
+        return _mesh_fingerprint(mesh, obj.matrix_world, obj.data.materials)
+    finally:
+        eval_obj.to_mesh_clear()
+
+
+# -------------------------------------------------
+# Eventos de exportación
+# -------------------------------------------------
+def _replace_file(src, dst, attempts=5):
+    """os.replace con reintentos: en Windows falla si otro programa tiene el destino abierto"""
+    for i in range(attempts):
+        try:
+            os.replace(src, dst)
+            return
+        except PermissionError:
+            if i == attempts - 1:
+                raise
+            time.sleep(0.1)
+
+
+def _lock_events(lock_file):
+    """Bloqueo exclusivo entre procesos (varios Blender exportando a la misma raíz)"""
+    if fcntl is not None:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+    else:
+        lock_file.seek(0)
+        msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+
+
+def _unlock_events(lock_file):
+    if fcntl is not None:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+    else:
+        lock_file.seek(0)
+        msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def _append_event_log(base_dir, event):
+    """Añade el evento al archivo rotativo de la raíz de exportación.
+
+    Al pasar de EXPORT_EVENTS_MAX_BYTES el archivo se renombra a '.1' (sustituyendo
+    al anterior), así que siempre quedan el archivo actual y el previo completos.
+    """
+    path = os.path.join(base_dir, EXPORT_EVENTS_NAME)
+    line = json.dumps(event, ensure_ascii=False) + "\n"
+
+    with open(f"{path}.lock", "a+") as lock_file:
+        _lock_events(lock_file)
+        try:
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(line)
+
+            if os.path.getsize(path) > EXPORT_EVENTS_MAX_BYTES:
+                try:
+                    _replace_file(path, f"{path}.1")
+                except PermissionError:
+                    # Un lector lo tiene abierto (Windows): se rota en el próximo evento
+                    pass
+        finally:
+            _unlock_events(lock_file)
+
+
+_LOOPBACK_HOSTS = ("127.0.0.1", "::1", "localhost")
+
+
+def _send_event(endpoint, event):
+    """Envía el evento al canal local configurado. Sin oyente no es un error.
+
+    Oyente de prueba para UDP:
+    python -c "import socket; s=socket.socket(socket.AF_INET, socket.SOCK_DGRAM); s.bind(('127.0.0.1', 9000)); [print(s.recv(65536).decode(), end='') for _ in iter(int, 1)]"
+    """
+    endpoint = (endpoint or "").strip()
+    if not endpoint:
+        return
+
+    data = (json.dumps(event, ensure_ascii=False) + "\n").encode("utf-8")
+
+    host, sep, port = endpoint.rpartition(":")
+    if endpoint.isdigit() or (sep and host and port.isdigit()):
+        if endpoint.isdigit():
+            host, port = "127.0.0.1", endpoint
+        host = host.strip("[]").lower()
+        # Canal local: nunca se publican rutas de export fuera de esta máquina
+        if host not in _LOOPBACK_HOSTS:
+            raise ValueError(f"El canal UDP debe ser local (127.0.0.1, ::1 o localhost): {endpoint}")
+        family = socket.AF_INET6 if host == "::1" else socket.AF_INET
+        address = ("127.0.0.1" if host == "localhost" else host, int(port))
+        sock = socket.socket(family, socket.SOCK_DGRAM)
+        try:
+            sock.sendto(data, address)
+        finally:
+            sock.close()
+        return
+
+    if os.name == "nt":
+        # Named pipe: \\.\pipe\nombre. Nunca se abre otra ruta: se sobrescribiría el archivo
+        if not endpoint.startswith("\\\\.\\pipe\\"):
+            raise ValueError(f"No es un named pipe: {endpoint}")
+        try:
+            with open(endpoint, "wb") as f:
+                f.write(data)
+        except FileNotFoundError:
+            # Ningún servidor escuchando en el pipe
+            pass
+        return
+
+    # FIFO: solo si la ruta existe y es realmente un FIFO (una ruta mal escrita no debe
+    # sobrescribir un archivo normal ni fallar en silencio)
+    try:
+        mode = os.stat(endpoint).st_mode
+    except FileNotFoundError:
+        raise ValueError(f"El canal no existe: {endpoint}")
+    if not stat.S_ISFIFO(mode):
+        raise ValueError(f"El canal no es un FIFO: {endpoint}")
+
+    try:
+        # No bloquear si nadie está leyendo
+        fd = os.open(endpoint, os.O_WRONLY | os.O_NONBLOCK)
+    except OSError as e:
+        if e.errno == errno.ENXIO:
+            return
+        raise
+    try:
+        os.write(fd, data)
+    except BrokenPipeError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _publish_export_event(base_dir, event):
+    """Publica el evento de export en el archivo rotativo y en el canal opcional"""
+    _append_event_log(base_dir, event)
+
+    try:
+        endpoint = bpy.context.preferences.addons[ADDON_ID].preferences.event_endpoint
+    except Exception:
+        endpoint = ""
+    _send_event(endpoint, event)
+
+
+# -------------------------------------------------
+# Naming / rutas
+# -------------------------------------------------
+def _compose_name(prefix, base):
+    """Nombre final del renombrado: prefijo + nombre, sin espacios sobrantes"""
+    return f"{(prefix or '').strip()}{(base or '').strip()}"
+
+
+def _export_paths(base_dir, export_name):
+    """(carpeta del objeto, FBX final, FBX temporal) para una raíz ya absoluta"""
+    export_dir = os.path.join(base_dir, export_name)
+    final_fbx_path = os.path.join(export_dir, f"{export_name}.fbx")
+    # Temporal oculto en la misma carpeta (el rename final es atómico) y sin acabar
+    # en .fbx, para que ningún watcher de *.fbx lo recoja a medio escribir
+    tmp_fbx_path = os.path.join(export_dir, f".{export_name}.fbx.{os.getpid()}.tmp")
+    return export_dir, final_fbx_path, tmp_fbx_path
+
+
+# -------------------------------------------------
+# Ordenar por nombre
+# -------------------------------------------------
+def _is_editable(id_data):
+    """False para datos enlazados de una librería (u overrides), que no admiten link/unlink"""
+    return getattr(id_data, "library", None) is None and getattr(id_data, "override_library", None) is None
+
+
+def _parse_sort_rules(text):
+    """'_high, ref_' -> (prefijos, sufijos) en minúsculas. Terminadas en '_' son prefijos"""
+    prefixes = []
+    suffixes = []
+    for rule in (text or "").split(","):
+        rule = rule.strip().lower()
+        if not rule:
+            continue
+        if rule.endswith("_"):
+            prefixes.append(rule)
+        else:
+            suffixes.append(rule)
+    return tuple(prefixes), tuple(suffixes)
+
+
+def _classify_name(name, rules):
+    """Devuelve la clave del primer grupo de reglas que encaja con el nombre, o None.
+
+    rules: secuencia de (clave, prefijos, sufijos). Se ignora el sufijo numérico de Blender (.001).
+    """
+    base, dot, num = name.rpartition(".")
+    if dot and num.isdigit():
+        name = base
+    name = name.lower()
+
+    for key, prefixes, suffixes in rules:
+        if name.startswith(prefixes) or name.endswith(suffixes):
+            return key
+    return None
+
+
 # -------------------------------------------------
 # Export core
 # -------------------------------------------------
@@ -396,9 +1080,13 @@ def _export_active_mesh_to_fbx(context, base_dir, report_fn):
             report_fn({"ERROR"}, "No se pudo crear/usar la carpeta de exportación.")
             return False
 
-    export_dir = os.path.join(base_dir, export_name)
+    # Se escribe a un temporal en la misma carpeta y se renombra al final,
+    # así ningún watcher (Substance) llega a leer un FBX a medias.
+    export_dir, final_fbx_path, tmp_fbx_path = _export_paths(base_dir, export_name)
     os.makedirs(export_dir, exist_ok=True)
-    final_fbx_path = os.path.join(export_dir, f"{export_name}.fbx")
+
+    t_start = time.perf_counter()
+    signature = _object_signature(src)
 
     depsgraph = context.evaluated_depsgraph_get()
     eval_obj = src.evaluated_get(depsgraph)
@@ -412,6 +1100,9 @@ def _export_active_mesh_to_fbx(context, base_dir, report_fn):
     except TypeError:
         baked_mesh = bpy.data.meshes.new_from_object(eval_obj, preserve_all_data_layers=True)
 
+    # Huella antes de aplicar transformaciones a la copia: es la misma que calcula la revisión
+    source_hash = _mesh_fingerprint(baked_mesh, src.matrix_world, src.data.materials)
+
     tmp_obj = bpy.data.objects.new(f"{export_name}_EXPORT_TMP", baked_mesh)
 
     if src.data and src.data.materials:
@@ -440,16 +1131,23 @@ def _export_active_mesh_to_fbx(context, base_dir, report_fn):
     bpy.ops.object.origin_set(type="ORIGIN_GEOMETRY", center="BOUNDS")
     tmp_obj.location = (0.0, 0.0, 0.0)
 
-    bpy.ops.export_scene.fbx(
-        filepath=final_fbx_path,
-        use_selection=True,
-        object_types={'MESH'},
-        apply_unit_scale=True,
-        axis_forward='-Z',
-        axis_up='Y',
-        add_leaf_bones=False,
-        use_mesh_modifiers=False,
-    )
+    t_baked = time.perf_counter()
+    export_error = None
+    try:
+        bpy.ops.export_scene.fbx(
+            filepath=tmp_fbx_path,
+            use_selection=True,
+            object_types={'MESH'},
+            apply_unit_scale=True,
+            axis_forward='-Z',
+            axis_up='Y',
+            add_leaf_bones=False,
+            use_mesh_modifiers=False,
+        )
+        _replace_file(tmp_fbx_path, final_fbx_path)
+    except Exception as e:
+        export_error = str(e)
+    t_exported = time.perf_counter()
 
     tmp_obj.select_set(False)
     for o in prev_sel:
@@ -472,6 +1170,44 @@ def _export_active_mesh_to_fbx(context, base_dir, report_fn):
             pass
         bpy.data.collections.remove(tmp_col)
 
+    if export_error is not None:
+        if os.path.exists(tmp_fbx_path):
+            try:
+                os.remove(tmp_fbx_path)
+            except Exception:
+                pass
+        report_fn({"ERROR"}, f"Error al exportar: {export_error[:80]}")
+        return False
+
+    content_hash = None
+    try:
+        content_hash = _file_sha1(final_fbx_path)
+        _index_record_export(
+            base_dir, final_fbx_path, export_name, bpy.data.filepath, source_hash, signature,
+            content_hash,
+        )
+    except Exception as e:
+        report_fn({"WARNING"}, f"No se pudo actualizar el índice: {str(e)[:50]}")
+
+    t_end = time.perf_counter()
+    event = {
+        "event": "export",
+        "time": time.time(),
+        "path": final_fbx_path,
+        "object": export_name,
+        "blend": bpy.data.filepath,
+        "hash": content_hash,
+        "timings_ms": {
+            "bake": round((t_baked - t_start) * 1000.0, 2),
+            "export": round((t_exported - t_baked) * 1000.0, 2),
+            "total": round((t_end - t_start) * 1000.0, 2),
+        },
+    }
+    try:
+        _publish_export_event(base_dir, event)
+    except Exception as e:
+        report_fn({"WARNING"}, f"No se pudo publicar el evento: {str(e)[:50]}")
+
     report_fn({"INFO"}, f"Exportado: {final_fbx_path}")
     return True
 
@@ -525,6 +1261,112 @@ class MANWTOOL_OT_create_folders(Operator):
         return {"FINISHED"}
 
 
+class MANWTOOL_OT_sort_objects(Operator):
+    bl_idname = "manwtool.sort_objects"
+    bl_label = "Ordenar objetos"
+    bl_description = "Mueve los objetos a _High, _Low o _Reference según las reglas de nombre"
+    bl_options = {"REGISTER", "UNDO"}
+
+    dry_run: BoolProperty(
+        name="Solo previsualizar",
+        description="Calcula los movimientos sin aplicarlos",
+        default=False,
+    )
+
+    def execute(self, context):
+        global _sort_preview
+
+        props = context.scene.manwtool_props
+        base = (props.root_name or "").strip()
+        if not base:
+            self.report({"ERROR"}, "Escribe un nombre para la raíz.")
+            return {"CANCELLED"}
+
+        scene_col = context.scene.collection
+        scene_cols = list(scene_col.children_recursive)
+
+        # Solo colecciones de esta escena: si no, los objetos acabarían fuera de ella
+        targets = {
+            "HIGH": bpy.data.collections.get(f"{base}_High"),
+            "LOW": bpy.data.collections.get(f"{base}_Low"),
+            "REF": bpy.data.collections.get(f"{base}_Reference"),
+        }
+        if any(col is None or col not in scene_cols for col in targets.values()):
+            self.report({"ERROR"}, "Crea la estructura primero.")
+            return {"CANCELLED"}
+
+        rules = (
+            ("HIGH",) + _parse_sort_rules(props.sort_high_rules),
+            ("LOW",) + _parse_sort_rules(props.sort_low_rules),
+            ("REF",) + _parse_sort_rules(props.sort_ref_rules),
+        )
+
+        if props.sort_selected_only:
+            objects = list(context.selected_objects)
+        else:
+            objects = list(scene_col.all_objects)
+
+        # Índice objeto -> colecciones de la escena en una sola pasada
+        # (obj.users_collection recorre todas las colecciones en cada llamada).
+        # Clave por puntero: el nombre no es único con objetos enlazados de librerías.
+        obj_cols = {}
+        for col in [scene_col] + scene_cols:
+            for o in col.objects:
+                obj_cols.setdefault(o.as_pointer(), []).append(col)
+
+        counts = {key: 0 for key in targets}
+        moves = []
+        unchanged = 0
+        unmatched = 0
+        blocked = 0
+
+        # Primero se calcula y valida la lista completa; nada se toca hasta el final
+        for obj in objects:
+            key = _classify_name(obj.name, rules)
+            if key is None:
+                unmatched += 1
+                continue
+
+            target = targets[key]
+            cols = obj_cols.get(obj.as_pointer(), [])
+            if len(cols) == 1 and cols[0] == target:
+                unchanged += 1
+                continue
+
+            # Colecciones de una librería no se pueden modificar: link/unlink fallaría a mitad
+            if not _is_editable(target) or any(not _is_editable(col) for col in cols if col != target):
+                blocked += 1
+                continue
+
+            counts[key] += 1
+            moves.append((obj, target, cols))
+
+        if not self.dry_run:
+            for obj, target, cols in moves:
+                if target not in cols:
+                    target.objects.link(obj)
+                for col in cols:
+                    if col != target:
+                        col.objects.unlink(obj)
+
+        _sort_preview = {
+            "applied": not self.dry_run,
+            "counts": {targets[key].name: n for key, n in counts.items()},
+            "unchanged": unchanged,
+            "unmatched": unmatched,
+            "blocked": blocked,
+            "moves": [(obj.name, target.name) for obj, target, cols in moves[:8]],
+        }
+
+        verb = "Se moverían" if self.dry_run else "Movidos"
+        self.report(
+            {"WARNING"} if blocked else {"INFO"},
+            f"{verb}: {len(moves)} objetos ({unchanged} ya en su sitio, {unmatched} sin regla, "
+            f"{blocked} en colecciones de librería)",
+        )
+        return {"FINISHED"}
+
+
 class MANWTOOL_OT_rename_geo_data_material(Operator):
     bl_idname = "manwtool.rename_geo_data_material"
     bl_label = "Aplicar nombre"
@@ -541,13 +1383,11 @@ class MANWTOOL_OT_rename_geo_data_material(Operator):
             return {"CANCELLED"}
 
         props = context.scene.manwtool_props
-        prefix = (props.rename_prefix or "").strip()
-        base = (props.rename_base or "").strip()
-        if not base:
+        if not (props.rename_base or "").strip():
             self.report({"ERROR"}, "Escribe un nombre.")
             return {"CANCELLED"}
 
-        final_name = f"{prefix}{base}"
+        final_name = _compose_name(props.rename_prefix, props.rename_base)
 
         obj.name = final_name
         if obj.data:
@@ -614,6 +1454,123 @@ class MANWTOOL_OT_reexport_fbx(Operator):
         return {"FINISHED"} if ok else {"CANCELLED"}
 
 
+class MANWTOOL_OT_check_export_index(Operator):
+    """Revisa el índice de exportación.
+
+    También funciona sin interfaz, p.ej.:
+    blender -b escena.blend --python-expr "import bpy; bpy.ops.manwtool.check_export_index(directory='//export')"
+    """
+    bl_idname = "manwtool.check_export_index"
+    bl_label = "Revisar índice"
+    bl_description = "Lista los exports obsoletos, perdidos o huérfanos de la carpeta de exportación"
+    bl_options = {"REGISTER"}
+
+    directory: StringProperty(
+        name="Carpeta",
+        description="Raíz de exportación a revisar. Vacío = última carpeta",
+        subtype="DIR_PATH",
+        default="",
+    )
+    deep: BoolProperty(
+        name="Revisión profunda",
+        description="Evalúa la malla (modificadores incluidos) de los objetos cuya firma coincide. "
+                    "Más lento; la revisión normal ya detecta cambios de geometría, UVs y modificadores",
+        default=False,
+    )
+
+    def execute(self, context):
+        global _index_status
+
+        base_dir = (self.directory or context.scene.manwtool_props.last_export_dir or "").strip()
+        if not base_dir:
+            self.report({"ERROR"}, "No hay carpeta guardada. Haz un Export primero.")
+            return {"CANCELLED"}
+        base_dir = bpy.path.abspath(base_dir)
+
+        t0 = time.perf_counter()
+        try:
+            result = _index_query(
+                base_dir,
+                bpy.data.filepath,
+                _current_signature,
+                _current_source_hash if self.deep else None,
+            )
+        except Exception as e:
+            _index_status["error"] = f"Error al leer el índice: {str(e)[:50]}"
+            self.report({"ERROR"}, _index_status["error"])
+            return {"CANCELLED"}
+        elapsed_ms = (time.perf_counter() - t0) * 1000.0
+
+        _index_status.update(result)
+        _index_status["base_dir"] = base_dir
+        _index_status["elapsed_ms"] = elapsed_ms
+        _index_status["error"] = None
+
+        for key in ("stale", "missing", "orphaned", "modified"):
+            for name, fbx_rel, blend in result[key]:
+                print(f"[ManWTool] {key}: {name} -> {fbx_rel} ({blend or 'sin guardar'})")
+
+        self.report(
+            {"INFO"},
+            f"Índice: {result['total']} exports, {len(result['stale'])} obsoletos, "
+            f"{len(result['missing'])} perdidos, {len(result['orphaned'])} huérfanos "
+            f"({elapsed_ms:.1f} ms)",
+        )
+        return {"FINISHED"}
+
+
+class MANWTOOL_OT_reexport_stale(Operator):
+    bl_idname = "manwtool.reexport_stale"
+    bl_label = "ReExport obsoletos"
+    bl_description = "Reexporta solo los objetos de este .blend obsoletos o perdidos según la última revisión"
+    bl_options = {"REGISTER"}
+
+    def execute(self, context):
+        base_dir = _index_status["base_dir"]
+        if not base_dir:
+            self.report({"ERROR"}, "Revisa el índice primero.")
+            return {"CANCELLED"}
+
+        blend_file = bpy.data.filepath
+        names = []
+        for name, fbx_rel, blend in _index_status["stale"] + _index_status["missing"]:
+            if blend_file and blend == blend_file and name not in names:
+                names.append(name)
+
+        view_layer = context.view_layer
+        prev_active = view_layer.objects.active
+        exported = 0
+        problems = []
+
+        def collect(level, message):
+            if level & {"ERROR", "WARNING"}:
+                problems.append((level, f"{name}: {message}"))
+
+        for name in names:
+            obj = bpy.data.objects.get(name)
+            if obj is None or obj.type != "MESH" or obj.name not in view_layer.objects:
+                problems.append(({"WARNING"}, f"{name}: no está en la capa de vista actual"))
+                continue
+            view_layer.objects.active = obj
+            if _export_active_mesh_to_fbx(context, base_dir, collect):
+                exported += 1
+
+        if prev_active and prev_active.name in view_layer.objects:
+            view_layer.objects.active = prev_active
+
+        for level, message in problems:
+            self.report(level, message)
+
+        bpy.ops.manwtool.check_export_index(directory=base_dir)
+
+        if exported == 0:
+            self.report({"ERROR"}, f"No se reexportó ningún objeto (0/{len(names)})")
+            return {"CANCELLED"}
+
+        self.report({"INFO"}, f"Reexportados: {exported}/{len(names)}")
+        return {"FINISHED"}
+
+
 # -------------------------------------------------
 # Panels
 # -------------------------------------------------
@@ -629,10 +1586,12 @@ class MANWTOOL_PT_folders(MANWTOOL_PT_base):
     bl_options = {"DEFAULT_CLOSED"}
 
     def draw(self, context):
-        _draw_header(self, context, show_status=False)
+        state = _panel_state(context)
+        _draw_header(self, state, show_status=False)
         
         # Mostrar notificación de actualización
-        _draw_update_notification(self.layout)
+        if state["show_update"]:
+            _draw_update_notification(self.layout)
         
         layout = self.layout
         props = context.scene.manwtool_props
@@ -647,6 +1606,21 @@ class MANWTOOL_PT_folders(MANWTOOL_PT_base):
         btn = _big_button(box)
         btn.operator("manwtool.create_folders", icon="PLUS")
 
+        box = layout.box()
+        box.label(text="Ordenar por nombre", icon="SORTALPHA")
+
+        col = box.column(align=True)
+        col.prop(props, "sort_high_rules")
+        col.prop(props, "sort_low_rules")
+        col.prop(props, "sort_ref_rules")
+        box.prop(props, "sort_selected_only")
+
+        row = box.row(align=True)
+        row.operator("manwtool.sort_objects", text="Previsualizar", icon="HIDE_OFF").dry_run = True
+        row.operator("manwtool.sort_objects", text="Ordenar", icon="CHECKMARK").dry_run = False
+
+        _draw_sort_preview(box)
+
 
 class MANWTOOL_PT_rename(MANWTOOL_PT_base):
     bl_label = "Geo / Data / Material"
@@ -654,7 +1628,8 @@ class MANWTOOL_PT_rename(MANWTOOL_PT_base):
     bl_options = {"DEFAULT_CLOSED"}
 
     def draw(self, context):
-        _draw_header(self, context, show_status=True)
+        state = _panel_state(context)
+        _draw_header(self, state, show_status=True)
         layout = self.layout
         props = context.scene.manwtool_props
 
@@ -665,17 +1640,14 @@ class MANWTOOL_PT_rename(MANWTOOL_PT_base):
         col.prop(props, "rename_prefix")
         col.prop(props, "rename_base")
 
-        final_name = f"{(props.rename_prefix or '').strip()}{(props.rename_base or '').strip()}"
         sub = box.box()
         sub.enabled = False
-        sub.label(text=f"Resultado: {final_name}", icon="CHECKMARK")
+        sub.label(text=f"Resultado: {state['rename_preview']}", icon="CHECKMARK")
 
         box.separator()
 
-        obj = context.active_object
-        can_run = (obj is not None and obj.type == "MESH")
         btn = _big_button(box)
-        btn.enabled = can_run
+        btn.enabled = state["can_run"]
         btn.operator("manwtool.rename_geo_data_material", icon="FILE_TICK")
 
 
@@ -685,9 +1657,9 @@ class MANWTOOL_PT_export(MANWTOOL_PT_base):
     bl_options = {"DEFAULT_CLOSED"}
 
     def draw(self, context):
-        _draw_header(self, context, show_status=True)
+        state = _panel_state(context)
+        _draw_header(self, state, show_status=True)
         layout = self.layout
-        props = context.scene.manwtool_props
 
         box = layout.box()
         box.label(text="FBX (Substance-friendly)", icon="EXPORT")
@@ -698,7 +1670,7 @@ class MANWTOOL_PT_export(MANWTOOL_PT_base):
         info.label(text="• Rot/Scale aplicados + Origin al centro")
         info.label(text="• Posición a (0,0,0) + carpeta por objeto")
 
-        last = bpy.path.abspath(props.last_export_dir) if props.last_export_dir else ""
+        last = state["last_dir"]
         row = box.row()
         row.label(text="Última carpeta:", icon="FILE_FOLDER")
         row2 = box.row()
@@ -707,8 +1679,7 @@ class MANWTOOL_PT_export(MANWTOOL_PT_base):
 
         box.separator()
 
-        obj = context.active_object
-        can_run = (obj is not None and obj.type == "MESH")
+        can_run = state["can_run"]
 
         row = box.row(align=True)
         row.scale_y = 1.35
@@ -717,9 +1688,11 @@ class MANWTOOL_PT_export(MANWTOOL_PT_base):
 
         row2 = box.row(align=True)
         row2.scale_y = 1.35
-        row2.enabled = can_run and bool((props.last_export_dir or "").strip())
+        row2.enabled = can_run and state["has_last_dir"]
         row2.operator("manwtool.reexport_fbx", text="ReExport", icon="FILE_REFRESH")
 
+        _draw_index_status(layout)
+
 
 # -------------------------------------------------
 # Registro
@@ -728,9 +1701,12 @@ classes = (
     MANWTOOL_Preferences,
     MANWTOOL_Properties,
     MANWTOOL_OT_create_folders,
+    MANWTOOL_OT_sort_objects,
     MANWTOOL_OT_rename_geo_data_material,
     MANWTOOL_OT_export_fbx,
     MANWTOOL_OT_reexport_fbx,
+    MANWTOOL_OT_check_export_index,
+    MANWTOOL_OT_reexport_stale,
     MANWTOOL_OT_check_updates,
     MANWTOOL_OT_install_update,
     MANWTOOL_OT_dismiss_update,
@@ -750,12 +1726,28 @@ def register():
     if _auto_check_updates not in bpy.app.handlers.load_post:
         bpy.app.handlers.load_post.append(_auto_check_updates)
 
+    # Caché de paneles: msgbus + handlers que msgbus no cubre
+    if _panel_cache_load_post not in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.append(_panel_cache_load_post)
+    for handlers in (bpy.app.handlers.undo_post, bpy.app.handlers.redo_post, bpy.app.handlers.save_post):
+        if _panel_cache_invalidate_handler not in handlers:
+            handlers.append(_panel_cache_invalidate_handler)
+    _subscribe_msgbus()
+    _invalidate_panel_cache()
+
 
 def unregister():
     # Remover handler
     if _auto_check_updates in bpy.app.handlers.load_post:
         bpy.app.handlers.load_post.remove(_auto_check_updates)
 
+    bpy.msgbus.clear_by_owner(_msgbus_owner)
+    if _panel_cache_load_post in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_panel_cache_load_post)
+    for handlers in (bpy.app.handlers.undo_post, bpy.app.handlers.redo_post, bpy.app.handlers.save_post):
+        if _panel_cache_invalidate_handler in handlers:
+            handlers.remove(_panel_cache_invalidate_handler)
+
     del bpy.types.Scene.manwtool_props
 
     for c in reversed(classes):
@@ -0,0 +1,166 @@
+"""Microbenchmarks de la lógica de ManWTool.py (sin Blender, sobre tests/fake_bpy.py).
+
+Uso:
+    python benchmarks/bench_core.py            # 100k elementos
+    python benchmarks/bench_core.py -n 10000 --objects 500 --verts 20000
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tests"))
+
+from fake_bpy import FakeMesh, FakeModifier, import_addon  # noqa: E402
+
+# ManWTool.py cargado sobre el bpy falso de los tests
+ManWTool, bpy = import_addon()
+_classify_name = ManWTool._classify_name
+_compose_name = ManWTool._compose_name
+_export_paths = ManWTool._export_paths
+_index_connect = ManWTool._index_connect
+_index_query = ManWTool._index_query
+_parse_release = ManWTool._parse_release
+_parse_sort_rules = ManWTool._parse_sort_rules
+_parse_version_tag = ManWTool._parse_version_tag
+
+
+def _bench(label, n, fn):
+    t0 = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - t0
+    print(f"{label:<38} {n:>8}  {elapsed * 1000.0:9.1f} ms  {elapsed / n * 1e6:7.2f} us/elem")
+    return elapsed
+
+
+def bench_versions(n):
+    tags = [f"v{i % 10}.{i % 7}.{i}" for i in range(n)]
+    releases = [
+        {"tag_name": tag, "body": "", "assets": [{"name": "a.zip", "browser_download_url": "u"}]}
+        for tag in tags
+    ]
+    _bench("_parse_version_tag", n, lambda: [_parse_version_tag(t) for t in tags])
+    _bench("_parse_release", n, lambda: [_parse_release(r, (5, 3, 0)) for r in releases])
+
+
+def bench_naming(n):
+    bases = [f"Object_{i:06d}" for i in range(n)]
+    _bench("_compose_name", n, lambda: [_compose_name("SM_", b) for b in bases])
+    _bench("_export_paths", n, lambda: [_export_paths("/exports", b) for b in bases])
+
+
+def bench_sort(n):
+    rules = (
+        ("HIGH",) + _parse_sort_rules("_high, _hp"),
+        ("LOW",) + _parse_sort_rules("_low, _lp"),
+        ("REF",) + _parse_sort_rules("ref_, _ref"),
+    )
+    suffixes = ("_high", "_low", "_HP.001", "_lp", "", ".003")
+    names = [f"{'ref_' if i % 11 == 0 else ''}Part{i}{suffixes[i % len(suffixes)]}" for i in range(n)]
+    _bench("_classify_name", n, lambda: [_classify_name(name, rules) for name in names])
+
+
+def bench_index(n):
+    root = tempfile.mkdtemp(prefix="manwtool_bench_")
+    try:
+        blend = os.path.join(root, "scene.blend")
+        open(blend, "wb").close()
+
+        rows = []
+        for i in range(n):
+            name = f"Object_{i:06d}"
+            folder = os.path.join(root, name)
+            os.mkdir(folder)
+            fbx = os.path.join(folder, f"{name}.fbx")
+            with open(fbx, "wb") as f:
+                f.write(b"FBX")
+            st = os.stat(fbx)
+            rows.append((f"{name}/{name}.fbx", name, blend, time.time(), st.st_mtime, st.st_size,
+                         "content", "source", "signature"))
+
+        conn = _index_connect(root)
+        with conn:
+            conn.executemany(
+                "INSERT INTO exports (fbx_path, object_name, blend_file, exported_at, fbx_mtime,"
+                " fbx_size, content_hash, source_hash, signature) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+        conn.close()
+
+        _bench("_index_query (headless)", n, lambda: _index_query(root))
+        _bench(
+            "_index_query (firma coincide)",
+            n,
+            lambda: _index_query(root, blend, lambda name: "signature"),
+        )
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+def bench_signature(objects, verts):
+    """Coste real por objeto de la revisión rápida: _index_query con _current_signature.
+
+    Cada objeto tiene `verts` vértices, una capa UV y dos modificadores. Las lecturas
+    foreach_get del bpy falso son copias de arrays, del mismo orden que las de Blender.
+    """
+    root = tempfile.mkdtemp(prefix="manwtool_bench_sig_")
+    try:
+        blend = os.path.join(root, "scene.blend")
+        open(blend, "wb").close()
+        cutter = bpy.data.objects.new("Cutter", FakeMesh("Cutter", 8))
+
+        rows = []
+        for i in range(objects):
+            name = f"Mesh_{i:05d}"
+            obj = bpy.data.objects.new(name, FakeMesh(name, verts))
+            obj.modifiers.append(FakeModifier("Subdivision", "SUBSURF", levels=2, quality=3))
+            obj.modifiers.append(FakeModifier("Boolean", "BOOLEAN", object=cutter, operation="DIFFERENCE"))
+
+            folder = os.path.join(root, name)
+            os.mkdir(folder)
+            fbx = os.path.join(folder, f"{name}.fbx")
+            with open(fbx, "wb") as f:
+                f.write(b"FBX")
+            st = os.stat(fbx)
+            rows.append((f"{name}/{name}.fbx", name, blend, time.time(), st.st_mtime, st.st_size,
+                         "content", "source", ManWTool._object_signature(obj)))
+
+        conn = _index_connect(root)
+        with conn:
+            conn.executemany(
+                "INSERT INTO exports (fbx_path, object_name, blend_file, exported_at, fbx_mtime,"
+                " fbx_size, content_hash, source_hash, signature) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+        conn.close()
+
+        result = {}
+
+        def run():
+            result.update(_index_query(root, blend, ManWTool._current_signature))
+
+        _bench(f"_index_query + firma ({verts} verts/obj)", objects, run)
+        assert not result["stale"], "ningún objeto cambió: no debería haber obsoletos"
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", type=int, default=100_000, help="elementos por benchmark")
+    parser.add_argument("--objects", type=int, default=2_000, help="objetos para la revisión con firma")
+    parser.add_argument("--verts", type=int, default=5_000, help="vértices por objeto en la revisión con firma")
+    args = parser.parse_args()
+
+    bench_versions(args.n)
+    bench_naming(args.n)
+    bench_sort(args.n)
+    bench_index(args.n)
+    bench_signature(args.objects, args.verts)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+import http.server
+import json
+import os
+import sys
+import threading
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import fake_bpy  # noqa: E402
+
+
+@pytest.fixture
+def addon():
+    """ManWTool importado sobre un bpy falso nuevo. Devuelve (módulo, bpy falso)"""
+    return fake_bpy.import_addon()
+
+
+class _ReleasesHandler(http.server.BaseHTTPRequestHandler):
+    def do_GET(self):
+        server = self.server
+        server.requests.append(self.path)
+        body = json.dumps(server.payload).encode()
+        self.send_response(server.status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def releases_server():
+    """Stub local de la API de releases de GitHub en un hilo.
+
+    Cambia server.payload / server.status para controlar la respuesta; server.url
+    es la URL a pasar a _fetch_latest_release.
+    """
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _ReleasesHandler)
+    server.payload = {}
+    server.status = 200
+    server.requests = []
+    server.url = f"http://127.0.0.1:{server.server_port}/repos/ManWitoo/ManWTool/releases/latest"
+
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
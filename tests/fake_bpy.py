@@ -0,0 +1,330 @@
+"""Sustituto mínimo de bpy para importar ManWTool.py fuera de Blender.
+
+import_addon() carga ManWTool.py sobre un bpy falso nuevo sin dejar nada en
+sys.modules, así que tests y benchmarks usan el mismo archivo que se instala.
+
+Solo cubre lo que usan los operadores y helpers probados: bpy.data (objetos y
+colecciones), un context con escena/capa de vista, y los módulos que el addon
+importa al cargarse (bpy.types, bpy.props, bpy.app.handlers, bpy_extras).
+bpy.msgbus guarda las suscripciones para poder comprobar register().
+"""
+
+import array
+import importlib.util
+import itertools
+import os
+import sys
+import types
+
+
+_pointers = itertools.count(1)
+
+
+class FakeStruct:
+    def __init__(self):
+        self._pointer = next(_pointers)
+
+    def as_pointer(self):
+        return self._pointer
+
+
+class FakeObjectList(list):
+    """bpy_prop_collection con link/unlink (Collection.objects / .children)"""
+
+    def link(self, item):
+        if item in self:
+            raise RuntimeError(f"'{item.name}' ya está enlazado")
+        self.append(item)
+
+    def unlink(self, item):
+        if item not in self:
+            raise RuntimeError(f"'{item.name}' no está enlazado")
+        self.remove(item)
+
+
+class FakeMatrix:
+    """Matrix 4x4 por filas (iterable y con to_3x3, como mathutils.Matrix)"""
+
+    def __init__(self, rows=None):
+        self.rows = [list(r) for r in (rows or [(1, 0, 0, 0), (0, 1, 0, 0), (0, 0, 1, 0), (0, 0, 0, 1)])]
+
+    def __iter__(self):
+        return iter(self.rows)
+
+    def to_3x3(self):
+        return [row[:3] for row in self.rows[:3]]
+
+    def copy(self):
+        return FakeMatrix(self.rows)
+
+
+class FakeElements:
+    """vertices / loops / uv_layer.data: longitud y foreach_get sobre un array plano"""
+
+    def __init__(self, values, width):
+        self.values = values
+        self.width = width
+
+    def __len__(self):
+        return len(self.values) // self.width
+
+    def foreach_get(self, attr, seq):
+        seq[:] = self.values
+
+
+class FakeUVLayer:
+    def __init__(self, name, uvs):
+        self.name = name
+        self.data = FakeElements(uvs, 2)
+
+
+class FakeMesh(FakeStruct):
+    """Malla con vert_count vértices en tiras de triángulos y una capa UV"""
+
+    def __init__(self, name, vert_count=8):
+        super().__init__()
+        self.name = name
+        loop_count = max(vert_count - 2, 0) * 3
+        coords = array.array("f", map(float, range(97))) * (vert_count * 3 // 97 + 1)
+        self.vertices = FakeElements(coords[:vert_count * 3], 3)
+        self.loops = FakeElements(array.array("i", [0, 1, 2]) * (loop_count // 3), 1)
+        self.uv_layers = [FakeUVLayer("UVMap", array.array("f", [0.5]) * (loop_count * 2))]
+        self.materials = []
+
+
+class FakeRNAProperty:
+    def __init__(self, identifier, type, array_length=0):
+        self.identifier = identifier
+        self.type = type
+        self.array_length = array_length
+
+
+class FakeModifier:
+    """Modificador cuyas propiedades se exponen por bl_rna.properties, como en Blender"""
+
+    def __init__(self, name, type, **values):
+        self.name = name
+        self.type = type
+        self.show_viewport = True
+        self.show_expanded = True
+        for key, value in values.items():
+            setattr(self, key, value)
+
+    @property
+    def bl_rna(self):
+        props = [FakeRNAProperty("rna_type", "POINTER")]
+        for key, value in vars(self).items():
+            if value is None or hasattr(value, "name"):
+                props.append(FakeRNAProperty(key, "POINTER"))
+            elif isinstance(value, tuple):
+                props.append(FakeRNAProperty(key, "FLOAT", len(value)))
+            elif isinstance(value, bool):
+                props.append(FakeRNAProperty(key, "BOOLEAN"))
+            elif isinstance(value, str):
+                props.append(FakeRNAProperty(key, "STRING"))
+            else:
+                props.append(FakeRNAProperty(key, "FLOAT"))
+        return types.SimpleNamespace(properties=props)
+
+
+class FakeObject(FakeStruct):
+    def __init__(self, name, data=None, type="MESH"):
+        super().__init__()
+        self.name = name
+        self.type = type
+        self.data = data
+        self.modifiers = []
+        self.matrix_world = FakeMatrix()
+
+
+class FakeCollection(FakeStruct):
+    def __init__(self, name):
+        super().__init__()
+        self.name = name
+        self.objects = FakeObjectList()
+        self.children = FakeObjectList()
+        self.color_tag = "NONE"
+        self.library = None
+
+    @property
+    def children_recursive(self):
+        result = []
+        for child in self.children:
+            result.append(child)
+            result.extend(child.children_recursive)
+        return result
+
+    @property
+    def all_objects(self):
+        seen = []
+        for col in [self] + self.children_recursive:
+            for obj in col.objects:
+                if obj not in seen:
+                    seen.append(obj)
+        return seen
+
+
+class FakeIDCollection:
+    """bpy.data.objects / bpy.data.collections"""
+
+    def __init__(self, factory):
+        self._factory = factory
+        self._items = {}
+
+    def new(self, name, *args):
+        item = self._factory(name, *args)
+        self._items[name] = item
+        return item
+
+    def get(self, name, default=None):
+        return self._items.get(name, default)
+
+    def remove(self, item, **kwargs):
+        self._items.pop(item.name, None)
+
+    def __contains__(self, name):
+        return name in self._items
+
+    def __iter__(self):
+        return iter(self._items.values())
+
+    def __len__(self):
+        return len(self._items)
+
+
+class FakeScene(FakeStruct):
+    def __init__(self, props):
+        super().__init__()
+        self.collection = FakeCollection("Scene Collection")
+        self.manwtool_props = props
+
+
+class FakeContext:
+    def __init__(self, scene):
+        self.scene = scene
+        self.active_object = None
+        self.selected_objects = []
+        self.preferences = types.SimpleNamespace(addons={})
+
+
+class Operator:
+    """Base de operadores: guarda lo que se reporta para poder comprobarlo"""
+
+    def __init__(self):
+        self.reports = []
+
+    def report(self, level, message):
+        self.reports.append((level, message))
+
+
+class FakeMsgBus:
+    """bpy.msgbus que guarda las suscripciones (key, owner, notify) para poder comprobarlas"""
+
+    def __init__(self):
+        self.subscriptions = []
+
+    def subscribe_rna(self, key, owner, args, notify, options=frozenset()):
+        self.subscriptions.append((key, owner, args, notify))
+
+    def clear_by_owner(self, owner):
+        self.subscriptions = [sub for sub in self.subscriptions if sub[1] is not owner]
+
+    def keys(self, owner):
+        return [sub[0] for sub in self.subscriptions if sub[1] is owner]
+
+    def publish(self, key):
+        """Simula un cambio en key: llama a quien esté suscrito"""
+        for sub_key, owner, args, notify in list(self.subscriptions):
+            if sub_key == key:
+                notify(*args)
+
+    def load_file(self, handlers):
+        """Como al abrir un .blend: Blender borra todas las suscripciones y luego corre load_post"""
+        self.subscriptions = []
+        for handler in list(handlers.load_post):
+            handler(None)
+
+
+def _prop(**kwargs):
+    return kwargs.get("default")
+
+
+def make_modules(props):
+    """Crea un bpy falso nuevo (con bpy.data y context vacíos) y los módulos que importa el addon"""
+    bpy = types.ModuleType("bpy")
+
+    bpy.types = types.ModuleType("bpy.types")
+    for name in ("Panel", "PropertyGroup", "AddonPreferences", "Scene", "Object", "LayerObjects", "Window"):
+        setattr(bpy.types, name, type(name, (), {}))
+    bpy.types.Operator = Operator
+
+    bpy.props = types.ModuleType("bpy.props")
+    for name in ("PointerProperty", "StringProperty", "BoolProperty", "EnumProperty", "IntProperty"):
+        setattr(bpy.props, name, _prop)
+
+    bpy.app = types.ModuleType("bpy.app")
+    bpy.app.handlers = types.ModuleType("bpy.app.handlers")
+    bpy.app.handlers.persistent = lambda fn: fn
+    for name in ("load_post", "save_post", "undo_post", "redo_post"):
+        setattr(bpy.app.handlers, name, [])
+
+    bpy.data = types.SimpleNamespace(
+        objects=FakeIDCollection(FakeObject),
+        collections=FakeIDCollection(FakeCollection),
+        filepath="",
+    )
+    bpy.path = types.SimpleNamespace(abspath=lambda path: path)
+    bpy.msgbus = FakeMsgBus()
+    bpy.utils = types.SimpleNamespace(
+        register_class=lambda cls: None,
+        unregister_class=lambda cls: None,
+    )
+    bpy.context = FakeContext(FakeScene(props))
+
+    bpy_extras = types.ModuleType("bpy_extras")
+    bpy_extras.io_utils = types.ModuleType("bpy_extras.io_utils")
+    bpy_extras.io_utils.ExportHelper = type("ExportHelper", (), {})
+
+    return {
+        "bpy": bpy,
+        "bpy.types": bpy.types,
+        "bpy.props": bpy.props,
+        "bpy.app": bpy.app,
+        "bpy.app.handlers": bpy.app.handlers,
+        "bpy_extras": bpy_extras,
+        "bpy_extras.io_utils": bpy_extras.io_utils,
+    }
+
+
+ADDON_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "ManWTool.py")
+
+
+def default_props():
+    return types.SimpleNamespace(
+        root_name="Asset",
+        rename_prefix="SM_",
+        rename_base="Object",
+        sort_high_rules="_high, _hp",
+        sort_low_rules="_low, _lp",
+        sort_ref_rules="ref_, _ref",
+        sort_selected_only=False,
+        last_export_dir="",
+    )
+
+
+def import_addon(props=None):
+    """Carga una copia independiente de ManWTool.py. Devuelve (módulo, bpy falso)"""
+    modules = make_modules(props if props is not None else default_props())
+    saved = {name: sys.modules.get(name) for name in modules}
+    sys.modules.update(modules)
+    try:
+        spec = importlib.util.spec_from_file_location("ManWTool", ADDON_PATH)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    finally:
+        for name, previous in saved.items():
+            if previous is None:
+                sys.modules.pop(name, None)
+            else:
+                sys.modules[name] = previous
+    return module, modules["bpy"]
@@ -0,0 +1,137 @@
+import json
+import os
+import socket
+
+import pytest
+
+from fake_bpy import import_addon
+
+
+ManWTool, _ = import_addon()
+EXPORT_EVENTS_NAME = ManWTool.EXPORT_EVENTS_NAME
+_append_event_log = ManWTool._append_event_log
+_send_event = ManWTool._send_event
+
+
+def _read_events(path):
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_append_event_log(tmp_path):
+    _append_event_log(str(tmp_path), {"event": "export", "object": "Rock"})
+    _append_event_log(str(tmp_path), {"event": "export", "object": "Árbol"})
+
+    events = _read_events(tmp_path / EXPORT_EVENTS_NAME)
+    assert [e["object"] for e in events] == ["Rock", "Árbol"]
+
+
+def test_event_log_rotates_to_backup(tmp_path, monkeypatch):
+    monkeypatch.setattr(ManWTool, "EXPORT_EVENTS_MAX_BYTES", 200)
+    path = str(tmp_path / EXPORT_EVENTS_NAME)
+
+    for i in range(40):
+        _append_event_log(str(tmp_path), {"i": i})
+
+    current = _read_events(path)
+    backup = _read_events(f"{path}.1")
+    assert os.path.getsize(path) <= 200
+    assert backup, "debería haber rotado al menos una vez"
+    # El último tramo completo se conserva y sin huecos hasta el final
+    seq = [e["i"] for e in backup + current]
+    assert seq == list(range(seq[0], 40))
+
+
+def test_send_event_udp():
+    listener = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    listener.bind(("127.0.0.1", 0))
+    listener.settimeout(2)
+    port = listener.getsockname()[1]
+    try:
+        _send_event(str(port), {"object": "Rock"})
+        _send_event(f"127.0.0.1:{port}", {"object": "Tree"})
+        received = [json.loads(listener.recv(65536)) for _ in range(2)]
+    finally:
+        listener.close()
+
+    assert [e["object"] for e in received] == ["Rock", "Tree"]
+
+
+def test_send_event_udp_localhost():
+    listener = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    listener.bind(("127.0.0.1", 0))
+    listener.settimeout(2)
+    port = listener.getsockname()[1]
+    try:
+        _send_event(f"localhost:{port}", {"object": "Rock"})
+        assert json.loads(listener.recv(65536)) == {"object": "Rock"}
+    finally:
+        listener.close()
+
+
+@pytest.mark.skipif(not socket.has_ipv6, reason="sin IPv6")
+def test_send_event_udp_ipv6_loopback():
+    try:
+        listener = socket.socket(socket.AF_INET6, socket.SOCK_DGRAM)
+        listener.bind(("::1", 0))
+    except OSError:
+        pytest.skip("::1 no disponible")
+    listener.settimeout(2)
+    port = listener.getsockname()[1]
+    try:
+        _send_event(f"[::1]:{port}", {"object": "Rock"})
+        _send_event(f"::1:{port}", {"object": "Tree"})
+        received = [json.loads(listener.recv(65536)) for _ in range(2)]
+    finally:
+        listener.close()
+
+    assert [e["object"] for e in received] == ["Rock", "Tree"]
+
+
+@pytest.mark.parametrize("endpoint", ["192.168.1.20:9000", "example.com:9000", "0.0.0.0:9000"])
+def test_send_event_udp_rejects_remote_hosts(endpoint):
+    with pytest.raises(ValueError, match="local"):
+        _send_event(endpoint, {"a": 1})
+
+
+def test_send_event_disabled():
+    _send_event("", {"object": "Rock"})
+    _send_event("   ", {"object": "Rock"})
+
+
+@pytest.mark.skipif(os.name == "nt", reason="FIFO POSIX")
+def test_send_event_fifo_without_reader_is_silent(tmp_path):
+    fifo = tmp_path / "events.fifo"
+    os.mkfifo(fifo)
+    _send_event(str(fifo), {"object": "Rock"})
+
+
+@pytest.mark.skipif(os.name == "nt", reason="FIFO POSIX")
+def test_send_event_fifo_with_reader(tmp_path):
+    fifo = tmp_path / "events.fifo"
+    os.mkfifo(fifo)
+    reader = os.open(fifo, os.O_RDONLY | os.O_NONBLOCK)
+    try:
+        _send_event(str(fifo), {"object": "Rock"})
+        assert json.loads(os.read(reader, 65536)) == {"object": "Rock"}
+    finally:
+        os.close(reader)
+
+
+@pytest.mark.skipif(os.name == "nt", reason="FIFO POSIX")
+def test_send_event_never_overwrites_regular_file(tmp_path):
+    target = tmp_path / "important.txt"
+    target.write_text("IMPORTANT DATA HERE\n")
+
+    with pytest.raises(ValueError, match="FIFO"):
+        _send_event(str(target), {"a": 1})
+
+    assert target.read_text() == "IMPORTANT DATA HERE\n"
+
+
+@pytest.mark.skipif(os.name == "nt", reason="FIFO POSIX")
+def test_send_event_missing_path_is_reported(tmp_path):
+    with pytest.raises(ValueError, match="no existe"):
+        _send_event(str(tmp_path / "nope.fifo"), {"a": 1})
@@ -0,0 +1,140 @@
+import os
+import sqlite3
+
+import pytest
+
+from fake_bpy import import_addon
+
+
+ManWTool, _ = import_addon()
+EXPORT_INDEX_NAME = ManWTool.EXPORT_INDEX_NAME
+_file_sha1 = ManWTool._file_sha1
+_index_query = ManWTool._index_query
+_index_record_export = ManWTool._index_record_export
+
+
+@pytest.fixture
+def export_root(tmp_path):
+    blend = tmp_path / "scene.blend"
+    blend.write_bytes(b"BLENDER")
+    root = tmp_path / "export"
+    root.mkdir()
+    return root, str(blend)
+
+
+def _export(root, name, blend, source_hash="h", signature="s", data=b"FBX"):
+    folder = root / name
+    folder.mkdir(exist_ok=True)
+    fbx = folder / f"{name}.fbx"
+    fbx.write_bytes(data)
+    return _index_record_export(str(root), str(fbx), name, blend, source_hash, signature)
+
+
+def _names(result, key):
+    return sorted(entry[0] for entry in result[key])
+
+
+def test_record_returns_content_hash(export_root):
+    root, blend = export_root
+    content_hash = _export(root, "Rock", blend)
+    assert content_hash == _file_sha1(str(root / "Rock" / "Rock.fbx"))
+
+
+def test_query_without_index(tmp_path):
+    result = _index_query(str(tmp_path))
+    assert result["total"] == 0
+    assert result["stale"] == result["missing"] == result["orphaned"] == []
+
+
+def test_query_headless(export_root):
+    root, blend = export_root
+    _export(root, "Rock", blend)
+    _export(root, "Tree", blend)
+    _export(root, "Gone", str(root / "deleted.blend"))
+    os.remove(root / "Tree" / "Tree.fbx")
+
+    result = _index_query(str(root))
+
+    assert result["total"] == 3
+    assert _names(result, "missing") == ["Tree"]
+    assert _names(result, "orphaned") == ["Gone"]
+    assert result["stale"] == []
+
+
+def test_query_detects_fbx_modified_on_disk(export_root):
+    root, blend = export_root
+    _export(root, "Rock", blend)
+    (root / "Rock" / "Rock.fbx").write_bytes(b"other, longer content")
+
+    assert _names(_index_query(str(root)), "modified") == ["Rock"]
+
+
+def test_query_stale_by_signature(export_root):
+    root, blend = export_root
+    _export(root, "Same", blend, signature="s1")
+    _export(root, "Changed", blend, signature="s2")
+    _export(root, "Deleted", blend)
+
+    signatures = {"Same": "s1", "Changed": "s2-changed"}
+    result = _index_query(str(root), blend, signatures.get)
+
+    assert _names(result, "stale") == ["Changed"]
+    assert _names(result, "orphaned") == ["Deleted"]
+
+
+def test_deep_check_only_evaluates_matching_signatures(export_root):
+    root, blend = export_root
+    _export(root, "Same", blend, source_hash="h1", signature="s1")
+    _export(root, "Changed", blend, source_hash="h2", signature="s2")
+    _export(root, "Evaluated", blend, source_hash="h3", signature="s3")
+
+    signatures = {"Same": "s1", "Changed": "s2-changed", "Evaluated": "s3"}
+    hashes = {"Same": "h1", "Evaluated": "h3-changed"}
+    hashed = []
+
+    def source_hash(name):
+        hashed.append(name)
+        return hashes[name]
+
+    result = _index_query(str(root), blend, signatures.get, source_hash)
+
+    assert _names(result, "stale") == ["Changed", "Evaluated"]
+    # La firma ya decide "Changed": solo se evalúan las que coinciden
+    assert sorted(hashed) == ["Evaluated", "Same"]
+
+
+def test_query_unsaved_blend_entries_are_orphaned(export_root):
+    root, blend = export_root
+    _export(root, "Rock", "")
+
+    # Aunque el archivo abierto tampoco esté guardado, no se compara con otra sesión
+    result = _index_query(str(root), "", lambda name: "s", lambda name: "h")
+
+    assert _names(result, "orphaned") == ["Rock"]
+    assert result["stale"] == []
+
+
+def test_reexport_replaces_row(export_root):
+    root, blend = export_root
+    _export(root, "Rock", blend, source_hash="old")
+    _export(root, "Rock", blend, source_hash="new")
+
+    result = _index_query(str(root), blend, lambda name: "s", lambda name: "new")
+    assert result["total"] == 1
+    assert result["stale"] == []
+
+
+def test_old_index_gets_signature_column(export_root):
+    root, blend = export_root
+    conn = sqlite3.connect(str(root / EXPORT_INDEX_NAME))
+    conn.execute(
+        "CREATE TABLE exports (fbx_path TEXT PRIMARY KEY, object_name TEXT NOT NULL,"
+        " blend_file TEXT NOT NULL, exported_at REAL NOT NULL, fbx_mtime REAL NOT NULL,"
+        " fbx_size INTEGER NOT NULL, content_hash TEXT NOT NULL, source_hash TEXT NOT NULL)"
+    )
+    conn.commit()
+    conn.close()
+
+    _export(root, "Rock", blend)
+
+    assert _index_query(str(root))["total"] == 1
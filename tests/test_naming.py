@@ -0,0 +1,69 @@
+import fnmatch
+import os
+
+import pytest
+
+from fake_bpy import import_addon
+
+
+ManWTool, _ = import_addon()
+_classify_name = ManWTool._classify_name
+_compose_name = ManWTool._compose_name
+_export_paths = ManWTool._export_paths
+_parse_sort_rules = ManWTool._parse_sort_rules
+
+
+def test_compose_name():
+    assert _compose_name("SM_", "Rock") == "SM_Rock"
+    assert _compose_name(" SM_ ", " Rock ") == "SM_Rock"
+    assert _compose_name(None, "Rock") == "Rock"
+    assert _compose_name("SM_", None) == "SM_"
+
+
+def test_export_paths():
+    base = os.path.join("exports", "props")
+    export_dir, final_path, tmp_path = _export_paths(base, "SM_Rock")
+
+    assert export_dir == os.path.join(base, "SM_Rock")
+    assert final_path == os.path.join(base, "SM_Rock", "SM_Rock.fbx")
+    # El temporal vive en la misma carpeta (rename atómico), oculto y sin extensión .fbx
+    assert os.path.dirname(tmp_path) == export_dir
+    assert os.path.basename(tmp_path) == f".SM_Rock.fbx.{os.getpid()}.tmp"
+    assert not fnmatch.fnmatch(os.path.basename(tmp_path), "*.fbx")
+    assert tmp_path != final_path
+
+
+def test_parse_sort_rules():
+    assert _parse_sort_rules("_High, ref_ ,, _LP") == (("ref_",), ("_high", "_lp"))
+    assert _parse_sort_rules("") == ((), ())
+    assert _parse_sort_rules(None) == ((), ())
+
+
+RULES = (
+    ("HIGH",) + _parse_sort_rules("_high, _hp"),
+    ("LOW",) + _parse_sort_rules("_low, _lp"),
+    ("REF",) + _parse_sort_rules("ref_, _ref"),
+)
+
+
+@pytest.mark.parametrize(
+    "name, expected",
+    [
+        ("Gun_high", "HIGH"),
+        ("Gun_HIGH.001", "HIGH"),
+        ("Gun_hp", "HIGH"),
+        ("gun_low", "LOW"),
+        ("Gun_LP.012", "LOW"),
+        ("REF_photo", "REF"),
+        ("photo_ref", "REF"),
+        ("Cube", None),
+        ("Gun_high.abc", None),
+        ("highway", None),
+    ],
+)
+def test_classify_name(name, expected):
+    assert _classify_name(name, RULES) == expected
+
+
+def test_classify_name_first_rule_wins():
+    assert _classify_name("ref_gun_low", RULES) == "LOW"
@@ -0,0 +1,162 @@
+"""Operadores y caché de paneles sobre el bpy falso (tests/fake_bpy.py)"""
+
+
+def _scene_with_structure(bpy, root="Asset"):
+    scene = bpy.context.scene
+    root_col = bpy.data.collections.new(root)
+    scene.collection.children.link(root_col)
+    for suffix in ("_High", "_Low", "_Reference"):
+        root_col.children.link(bpy.data.collections.new(f"{root}{suffix}"))
+
+    imported = bpy.data.collections.new("Imported")
+    scene.collection.children.link(imported)
+    for name in ("Gun_high", "Gun_low", "ref_gun", "Cube"):
+        imported.objects.link(bpy.data.objects.new(name))
+    return scene, imported
+
+
+def _names(collection):
+    return sorted(o.name for o in collection.objects)
+
+
+def test_sort_objects_moves_by_rules(addon):
+    module, bpy = addon
+    scene, imported = _scene_with_structure(bpy)
+
+    op = module.MANWTOOL_OT_sort_objects()
+    op.dry_run = False
+    assert op.execute(bpy.context) == {"FINISHED"}
+
+    assert _names(bpy.data.collections.get("Asset_High")) == ["Gun_high"]
+    assert _names(bpy.data.collections.get("Asset_Low")) == ["Gun_low"]
+    assert _names(bpy.data.collections.get("Asset_Reference")) == ["ref_gun"]
+    assert _names(imported) == ["Cube"]
+    assert module._sort_preview["applied"] is True
+    assert module._sort_preview["unmatched"] == 1
+
+
+def test_sort_objects_dry_run_changes_nothing(addon):
+    module, bpy = addon
+    scene, imported = _scene_with_structure(bpy)
+
+    op = module.MANWTOOL_OT_sort_objects()
+    op.dry_run = True
+    assert op.execute(bpy.context) == {"FINISHED"}
+
+    assert _names(imported) == ["Cube", "Gun_high", "Gun_low", "ref_gun"]
+    assert module._sort_preview["applied"] is False
+    assert module._sort_preview["counts"] == {"Asset_High": 1, "Asset_Low": 1, "Asset_Reference": 1}
+    assert ("Gun_high", "Asset_High") in module._sort_preview["moves"]
+
+
+def test_sort_objects_requires_structure_in_this_scene(addon):
+    module, bpy = addon
+    scene, imported = _scene_with_structure(bpy)
+    # La estructura existe en bpy.data pero no está enlazada a esta escena
+    scene.collection.children.unlink(bpy.data.collections.get("Asset"))
+
+    op = module.MANWTOOL_OT_sort_objects()
+    op.dry_run = False
+    assert op.execute(bpy.context) == {"CANCELLED"}
+    assert op.reports == [({"ERROR"}, "Crea la estructura primero.")]
+    assert _names(imported) == ["Cube", "Gun_high", "Gun_low", "ref_gun"]
+
+
+def test_sort_objects_already_sorted_is_unchanged(addon):
+    module, bpy = addon
+    scene, imported = _scene_with_structure(bpy)
+
+    op = module.MANWTOOL_OT_sort_objects()
+    op.dry_run = False
+    op.execute(bpy.context)
+    op.execute(bpy.context)
+
+    assert module._sort_preview["unchanged"] == 3
+    assert module._sort_preview["moves"] == []
+
+
+def test_sort_objects_skips_library_collections(addon):
+    module, bpy = addon
+    scene, imported = _scene_with_structure(bpy)
+    linked = bpy.data.collections.new("Linked")
+    linked.library = object()
+    scene.collection.children.link(linked)
+    bolt = bpy.data.objects.new("Bolt_high")
+    linked.objects.link(bolt)
+
+    op = module.MANWTOOL_OT_sort_objects()
+    op.dry_run = False
+    assert op.execute(bpy.context) == {"FINISHED"}
+
+    # El objeto enlazado se queda donde está y el resto se ordena igualmente
+    assert _names(linked) == ["Bolt_high"]
+    assert _names(bpy.data.collections.get("Asset_High")) == ["Gun_high"]
+    assert module._sort_preview["blocked"] == 1
+    assert op.reports[0][0] == {"WARNING"}
+
+
+def test_sort_objects_library_target_moves_nothing(addon):
+    module, bpy = addon
+    scene, imported = _scene_with_structure(bpy)
+    bpy.data.collections.get("Asset_High").library = object()
+
+    op = module.MANWTOOL_OT_sort_objects()
+    op.dry_run = False
+    op.execute(bpy.context)
+
+    assert _names(bpy.data.collections.get("Asset_High")) == []
+    assert _names(imported) == ["Cube", "Gun_high"]
+    assert module._sort_preview["blocked"] == 1
+    assert module._sort_preview["counts"]["Asset_High"] == 0
+
+
+def test_panel_state_recomputes_only_when_invalidated(addon):
+    module, bpy = addon
+    context = bpy.context
+    context.active_object = bpy.data.objects.new("SM_Rock")
+
+    for _ in range(5):
+        state = module._panel_state(context)
+    assert module._panel_stats == {"recomputes": 1, "redraws": 5}
+    assert state["status"] == ("Activo: SM_Rock (MESH)", "INFO", "MESH_CUBE")
+    assert state["rename_preview"] == "SM_Object"
+
+    context.scene.manwtool_props.rename_base = "Tree"
+    module._invalidate_panel_cache()
+    assert module._panel_state(context)["rename_preview"] == "SM_Tree"
+
+    # Cambiar el objeto activo se detecta aunque se pierda la notificación de msgbus
+    context.active_object = None
+    assert module._panel_state(context)["can_run"] is False
+    assert module._panel_stats["recomputes"] == 3
+
+
+def test_register_subscribes_msgbus_and_resubscribes_after_load(addon):
+    module, bpy = addon
+    owner = module._msgbus_owner
+    expected = [
+        (bpy.types.LayerObjects, "active"),
+        (bpy.types.Object, "name"),
+        (module.MANWTOOL_Properties, "root_name"),
+        (module.MANWTOOL_Properties, "rename_base"),
+    ]
+
+    module.register()
+    try:
+        keys = bpy.msgbus.keys(owner)
+        assert all(key in keys for key in expected)
+        assert len(keys) == len(set(keys))
+
+        # Al abrir un .blend Blender borra las suscripciones; load_post las recrea
+        bpy.msgbus.load_file(bpy.app.handlers)
+        assert module._panel_cache_load_post in bpy.app.handlers.load_post
+        assert bpy.msgbus.keys(owner) == keys
+
+        module._panel_state(bpy.context)
+        assert module._panel_cache["dirty"] is False
+        bpy.msgbus.publish((bpy.types.LayerObjects, "active"))
+        assert module._panel_cache["dirty"] is True
+    finally:
+        module.unregister()
+
+    assert bpy.msgbus.keys(owner) == []
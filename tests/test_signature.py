@@ -0,0 +1,93 @@
+"""Firma de objeto (revisión rápida del índice) sobre mallas falsas"""
+
+import pytest
+
+from fake_bpy import FakeMatrix, FakeMesh, FakeModifier
+
+
+@pytest.fixture
+def rock(addon):
+    module, bpy = addon
+    obj = bpy.data.objects.new("Rock", FakeMesh("Rock", 64))
+    cutter = bpy.data.objects.new("Cutter", FakeMesh("Cutter", 8))
+    obj.modifiers.append(FakeModifier("Subdivision", "SUBSURF", levels=1, quality=3))
+    obj.modifiers.append(FakeModifier("Boolean", "BOOLEAN", object=cutter, operation="DIFFERENCE"))
+    return module, obj, cutter
+
+
+def test_signature_is_stable(rock):
+    module, obj, cutter = rock
+    assert module._object_signature(obj) == module._object_signature(obj)
+
+
+def test_signature_ignores_location(rock):
+    module, obj, cutter = rock
+    before = module._object_signature(obj)
+    obj.matrix_world.rows[0][3] = 25.0
+    assert module._object_signature(obj) == before
+
+
+def test_signature_tracks_rotation_and_scale(rock):
+    module, obj, cutter = rock
+    before = module._object_signature(obj)
+    obj.matrix_world = FakeMatrix([(2, 0, 0, 0), (0, 2, 0, 0), (0, 0, 2, 0), (0, 0, 0, 1)])
+    assert module._object_signature(obj) != before
+
+
+def test_signature_tracks_uv_edits(rock):
+    module, obj, cutter = rock
+    before = module._object_signature(obj)
+    obj.data.uv_layers[0].data.values[10] = 0.75
+    assert module._object_signature(obj) != before
+
+
+def test_signature_tracks_geometry(rock):
+    module, obj, cutter = rock
+    before = module._object_signature(obj)
+    obj.data.vertices.values[0] += 1.0
+    assert module._object_signature(obj) != before
+
+
+def test_signature_tracks_modifier_parameters(rock):
+    module, obj, cutter = rock
+    before = module._object_signature(obj)
+    obj.modifiers[0].levels = 2
+    assert module._object_signature(obj) != before
+
+
+def test_signature_tracks_referenced_object_transform(rock):
+    module, obj, cutter = rock
+    before = module._object_signature(obj)
+    cutter.matrix_world.rows[2][3] = 0.5
+    assert module._object_signature(obj) != before
+
+
+def test_signature_ignores_ui_only_modifier_flags(rock):
+    module, obj, cutter = rock
+    before = module._object_signature(obj)
+    obj.modifiers[0].show_expanded = False
+    assert module._object_signature(obj) == before
+
+
+def test_index_query_uses_signature_without_evaluating(rock, tmp_path, monkeypatch):
+    module, obj, cutter = rock
+    blend = str(tmp_path / "scene.blend")
+    open(blend, "wb").close()
+    fbx = tmp_path / "Rock" / "Rock.fbx"
+    fbx.parent.mkdir()
+    fbx.write_bytes(b"FBX")
+    module._index_record_export(
+        str(tmp_path), str(fbx), "Rock", blend, "evaluated", module._object_signature(obj)
+    )
+
+    def no_eval(name):
+        raise AssertionError("la revisión normal no debe evaluar mallas")
+
+    monkeypatch.setattr(module, "_current_source_hash", no_eval)
+
+    result = module._index_query(str(tmp_path), blend, module._current_signature)
+    assert result["stale"] == []
+
+    obj.modifiers[0].levels = 3
+    result = module._index_query(str(tmp_path), blend, module._current_signature)
+    assert [e[0] for e in result["stale"]] == ["Rock"]
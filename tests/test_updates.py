@@ -0,0 +1,117 @@
+import urllib.error
+
+import pytest
+
+from fake_bpy import import_addon
+
+
+ManWTool, _ = import_addon()
+_compare_versions = ManWTool._compare_versions
+_fetch_latest_release = ManWTool._fetch_latest_release
+_find_zip_asset = ManWTool._find_zip_asset
+_parse_release = ManWTool._parse_release
+_parse_version_tag = ManWTool._parse_version_tag
+
+
+def _release(tag="v0.1.0", assets=None, body="Notas"):
+    if assets is None:
+        assets = [{"name": "ManWTool.zip", "browser_download_url": "https://example.invalid/ManWTool.zip"}]
+    return {"tag_name": tag, "assets": assets, "body": body}
+
+
+@pytest.mark.parametrize(
+    "tag, expected",
+    [
+        ("v0.0.8", (0, 0, 8)),
+        ("0.0.8", (0, 0, 8)),
+        ("V1.2.3", (1, 2, 3)),
+        (" v1.2.3.4 ", (1, 2, 3)),
+        ("v1.2", None),
+        ("v1.2.3-beta", None),
+        ("", None),
+        (None, None),
+    ],
+)
+def test_parse_version_tag(tag, expected):
+    assert _parse_version_tag(tag) == expected
+
+
+def test_compare_versions():
+    assert _compare_versions((0, 0, 9), (0, 0, 10))
+    assert _compare_versions((0, 9, 9), (1, 0, 0))
+    assert not _compare_versions((0, 0, 9), (0, 0, 9))
+    assert not _compare_versions((1, 0, 0), (0, 9, 9))
+
+
+def test_find_zip_asset_picks_first_zip():
+    assets = [
+        {"name": "notes.txt", "browser_download_url": "a"},
+        {"name": "ManWTool.zip", "browser_download_url": "b"},
+        {"name": "other.zip", "browser_download_url": "c"},
+    ]
+    assert _find_zip_asset(assets) == "b"
+    assert _find_zip_asset([]) is None
+    assert _find_zip_asset(None) is None
+
+
+def test_parse_release_newer():
+    version, url, notes = _parse_release(_release(body="x" * 300), (0, 0, 9))
+    assert version == (0, 1, 0)
+    assert url.endswith("ManWTool.zip")
+    assert len(notes) == 200
+
+
+def test_parse_release_up_to_date():
+    assert _parse_release(_release(tag="v0.0.9"), (0, 0, 9)) is None
+
+
+def test_parse_release_null_body():
+    assert _parse_release(_release(body=None), (0, 0, 9))[2] == ""
+
+
+def test_parse_release_invalid_tag():
+    with pytest.raises(ValueError, match="Formato de versión"):
+        _parse_release(_release(tag="latest"), (0, 0, 9))
+
+
+def test_parse_release_without_zip():
+    with pytest.raises(ValueError, match=".zip"):
+        _parse_release(_release(assets=[]), (0, 0, 9))
+
+
+def test_fetch_latest_release(releases_server):
+    releases_server.payload = _release()
+    data = _fetch_latest_release(releases_server.url)
+    assert data["tag_name"] == "v0.1.0"
+    assert releases_server.requests == ["/repos/ManWitoo/ManWTool/releases/latest"]
+
+
+def test_fetch_latest_release_http_error(releases_server):
+    releases_server.status = 404
+    with pytest.raises(urllib.error.HTTPError):
+        _fetch_latest_release(releases_server.url)
+
+
+def test_check_for_updates_thread(addon, releases_server, monkeypatch):
+    module, bpy = addon
+    monkeypatch.setattr(module, "GITHUB_API_URL", releases_server.url)
+    releases_server.payload = _release(tag="v9.0.0")
+
+    module._check_for_updates_thread()
+
+    info = module._update_info
+    assert info["available"] is True
+    assert info["version"] == (9, 0, 0)
+    assert info["error"] is None
+    assert info["checking"] is False
+
+
+def test_check_for_updates_thread_reports_bad_tag(addon, releases_server, monkeypatch):
+    module, bpy = addon
+    monkeypatch.setattr(module, "GITHUB_API_URL", releases_server.url)
+    releases_server.payload = _release(tag="nightly")
+
+    module._check_for_updates_thread()
+
+    assert module._update_info["available"] is False
+    assert module._update_info["error"] == "Formato de versión no válido en GitHub"